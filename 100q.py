@@ -1,6 +1,5 @@
 # Quantum_computing.py
 import networkx as nx
-import matplotlib.pyplot as plt
 import time
 import random
 from qiskit import QuantumCircuit
@@ -34,7 +33,10 @@ def classical_route(G):
 def plot_route(G, route, show_labels=False):
     """
     Plot only nodes + the final route edges.
+    Matplotlib is imported here so the timing runs don't pay its startup cost.
     """
+    import matplotlib.pyplot as plt
+
     pos = nx.spring_layout(G, seed=42)  # layout for visualization
     plt.figure(figsize=(14, 14))
 
@@ -58,7 +60,9 @@ def quantum_demo():
     Minimal quantum circuit to show timing and execution.
     (3 qubits only — can't scale to 500).
     """
-    qc = QuantumCircuit(3, 3)
+    # measure_all() adds its own classical register, so don't allocate a
+    # second one up front (QuantumCircuit(3, 3) would double the bits).
+    qc = QuantumCircuit(3)
     qc.h(0)
     qc.cx(0, 1)
     qc.cx(1, 2)
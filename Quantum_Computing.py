@@ -24,7 +24,9 @@ def classical_route(G):
 
 def quantum_demo():
     # Minimal quantum demo for timing
-    qc = QuantumCircuit(3, 3)
+    # measure_all() adds its own classical register, so don't allocate a
+    # second one up front (QuantumCircuit(3, 3) would double the bits).
+    qc = QuantumCircuit(3)
     qc.h(0)
     qc.cx(0, 1)
     qc.cx(1, 2)